@@ -65,9 +65,10 @@ def run_migrations_online() -> None:
 
     """
 
+    settings = get_settings()
     connectable = create_async_engine(
-        get_settings().DATABASE_URL,
-        echo=get_settings().DEBUG,
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
     )
 
     async def run_async_migration():
@@ -0,0 +1,60 @@
+"""timezone aware user timestamps
+
+Revision ID: 3c6f0d2a9e41
+Revises: f1f1fbfbec58
+Create Date: 2026-10-14 10:03:27.904113
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c6f0d2a9e41"
+down_revision: str | Sequence[str] | None = "f1f1fbfbec58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing naive values were written as UTC (datetime.utcnow)
+    op.alter_column(
+        "users",
+        "created_at",
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        "users",
+        "updated_at",
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="updated_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "users",
+        "updated_at",
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using="updated_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        "users",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        existing_nullable=False,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
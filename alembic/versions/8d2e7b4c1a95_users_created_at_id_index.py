@@ -0,0 +1,34 @@
+"""users created_at id index
+
+Revision ID: 8d2e7b4c1a95
+Revises: 3c6f0d2a9e41
+Create Date: 2026-10-14 13:27:42.518306
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e7b4c1a95"
+down_revision: str | Sequence[str] | None = "3c6f0d2a9e41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_users_created_at_id"),
+        "users",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_users_created_at_id"), table_name="users")
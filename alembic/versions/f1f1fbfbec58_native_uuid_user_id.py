@@ -0,0 +1,43 @@
+"""native uuid user id
+
+Revision ID: f1f1fbfbec58
+Revises: b9346c181676
+Create Date: 2026-10-14 09:12:41.518204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1f1fbfbec58"
+down_revision: str | Sequence[str] | None = "b9346c181676"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "users",
+        "id",
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using="id::uuid",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "users",
+        "id",
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using="id::text",
+    )
@@ -1,7 +1,16 @@
 """Core module - configuration and shared utilities."""
 
-from app.core.config import Settings, SettingsReloader, get_settings, reloader
-from app.core.database import AsyncSessionLocal, Base, engine, get_db
+from app.core.cache import TTLCache
+from app.core.config import Settings, SettingsReloader, get_settings, reload_settings, reloader
+from app.core.database import (
+    AsyncSessionLocal,
+    Base,
+    ReadOnlySessionLocal,
+    engine,
+    get_db,
+    get_db_readonly,
+    warm_pool,
+)
 from app.core.errors import (
     AppError,
     AuthenticationError,
@@ -9,6 +18,7 @@ from app.core.errors import (
     BusinessRuleError,
     DomainError,
     ErrorDetail,
+    ErrorEnvelope,
     ErrorResponse,
     InvalidOperationError,
     ResourceConflictError,
@@ -19,7 +29,14 @@ from app.core.errors import (
     validation_exception_handler,
 )
 from app.core.logging import setup_logging
-from app.core.validation import parse_uuid
+from app.core.responses import PydanticJSONResponse
+from app.core.validation import (
+    decode_cursor,
+    encode_cursor,
+    is_valid_email,
+    parse_uuid,
+    try_parse_uuid,
+)
 
 __all__ = [
     "AppError",
@@ -30,20 +47,31 @@ __all__ = [
     "BusinessRuleError",
     "DomainError",
     "ErrorDetail",
+    "ErrorEnvelope",
     "ErrorResponse",
     "InvalidOperationError",
+    "PydanticJSONResponse",
     "ResourceConflictError",
     "ResourceNotFoundError",
+    "ReadOnlySessionLocal",
     "Settings",
     "SettingsReloader",
+    "TTLCache",
     "ValidationError",
     "app_exception_handler",
+    "decode_cursor",
+    "encode_cursor",
     "engine",
     "get_db",
+    "get_db_readonly",
     "get_settings",
     "http_exception_handler",
+    "is_valid_email",
     "parse_uuid",
+    "reload_settings",
     "reloader",
     "setup_logging",
+    "try_parse_uuid",
     "validation_exception_handler",
+    "warm_pool",
 ]
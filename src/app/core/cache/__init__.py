@@ -0,0 +1,5 @@
+"""Cache module."""
+
+from app.core.cache.ttl_cache import TTLCache
+
+__all__ = ["TTLCache"]
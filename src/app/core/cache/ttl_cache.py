@@ -0,0 +1,124 @@
+"""
+In-process TTL cache with LRU eviction.
+
+Entries live in one worker process; there is no cross-process invalidation.
+Apart from get_or_load, operations never await, so the cache is safe to share
+between coroutines on one event loop without a lock.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+
+
+class _Load[V]:
+    """A load in flight; waiters block on ``done`` and then share its result."""
+
+    __slots__ = ("done", "loaded", "stale", "value")
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+        self.loaded = False
+        # Set by pop()/clear() when the key is invalidated mid-load
+        self.stale = False
+        self.value: V | None = None
+
+
+class TTLCache[K, V]:
+    """Bounded mapping whose entries expire ``ttl`` seconds after being set."""
+
+    __slots__ = ("_data", "_inflight", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted.
+            ttl: Default time to live of an entry, in seconds.
+        """
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._inflight: dict[K, _Load[V]] = {}
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at <= monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, optionally with its own time to live."""
+        data = self._data
+        data[key] = (value, monotonic() + (self._ttl if ttl is None else ttl))
+        data.move_to_end(key)
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    async def get_or_load(self, key: K, loader: Callable[[K], Awaitable[V | None]]) -> V | None:
+        """
+        Return the cached value, loading and caching it on a miss.
+
+        Concurrent misses for the same key share one load: later callers wait
+        for the first one and get its result, None included. A None result
+        is not cached, and neither is a result whose key was
+        invalidated with pop() or clear() while the load was running (the
+        loader may have read the value before the change that invalidated it).
+
+        Args:
+            key: Cache key, also passed to the loader.
+            loader: Coroutine function fetching the value for a key.
+
+        Returns:
+            The cached or loaded value, or None if the loader found nothing.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            await pending.done.wait()
+            if pending.loaded:
+                return pending.value
+            # The first load raised or was cancelled; do our own
+            return await loader(key)
+
+        pending = self._inflight[key] = _Load()
+        try:
+            value = await loader(key)
+            pending.value = value
+            pending.loaded = True
+            if value is not None and not pending.stale:
+                self.set(key, value)
+            return value
+        finally:
+            del self._inflight[key]
+            pending.done.set()
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value (None if it was not cached)."""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            pending.stale = True
+        item = self._data.pop(key, None)
+        return None if item is None else item[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for pending in self._inflight.values():
+            pending.stale = True
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
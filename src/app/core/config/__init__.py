@@ -1,5 +1,11 @@
 """Configuration module."""
 
-from app.core.config.settings import Settings, SettingsReloader, get_settings, reloader
+from app.core.config.settings import (
+    Settings,
+    SettingsReloader,
+    get_settings,
+    reload_settings,
+    reloader,
+)
 
-__all__ = ["Settings", "SettingsReloader", "get_settings", "reloader"]
+__all__ = ["Settings", "SettingsReloader", "get_settings", "reload_settings", "reloader"]
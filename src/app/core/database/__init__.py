@@ -1,5 +1,21 @@
 """Database module."""
 
-from app.core.database.session import AsyncSessionLocal, Base, engine, get_db
+from app.core.database.session import (
+    AsyncSessionLocal,
+    Base,
+    ReadOnlySessionLocal,
+    engine,
+    get_db,
+    get_db_readonly,
+    warm_pool,
+)
 
-__all__ = ["AsyncSessionLocal", "Base", "engine", "get_db"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "ReadOnlySessionLocal",
+    "engine",
+    "get_db",
+    "get_db_readonly",
+    "warm_pool",
+]
@@ -2,17 +2,35 @@
 Database configuration and session management.
 """
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import event, text
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from ..config import get_settings
 
-# Create database engine
+_settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# Create database engine. SQL logging is controlled through the
+# "sqlalchemy.engine" logger (see logging_config) rather than echo.
+# The pool must be the asyncio-aware AsyncAdaptedQueuePool: a plain QueuePool
+# blocks the event loop while waiting for a free connection.
 engine = create_async_engine(
-    get_settings().DATABASE_URL,
-    echo=get_settings().DEBUG,
+    _settings.DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=_settings.DB_POOL_SIZE,
+    max_overflow=_settings.DB_MAX_OVERFLOW,
+    pool_recycle=3600,
+    pool_pre_ping=True,
+    query_cache_size=1200,
 )
 
 # Create session factory
@@ -20,8 +38,60 @@ AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
-# Base class for SQLAlchemy models
-Base = declarative_base()
+# Session factory for pure reads. It runs on an AUTOCOMMIT view of the same
+# engine (and pool), so requests that never write skip BEGIN/ROLLBACK.
+ReadOnlySessionLocal = async_sessionmaker(
+    bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    info={"readonly": True},
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_readonly_flush(session: Session, flush_context: object, instances: object) -> None:
+    """Refuse to flush ORM changes through a read-only session."""
+    if session.info.get("readonly"):
+        raise InvalidRequestError("Cannot flush changes through a read-only session")
+
+
+class Base(DeclarativeBase):
+    """Base class for SQLAlchemy models."""
+
+    pass
+
+
+async def warm_pool(connections: int | None = None, timeout: float = 5.0) -> None:
+    """
+    Open pool connections ahead of the first requests.
+
+    The connections are opened concurrently and returned to the pool, so
+    early requests do not pay the connect + auth handshake. A database that
+    is not reachable yet is logged, not raised; requests will connect lazily.
+    The first failed ping cancels the others, and the whole warm-up gives up
+    after ``timeout`` seconds so an unreachable host cannot stall startup.
+
+    Args:
+        connections: Number of connections to open (defaults to DB_POOL_SIZE).
+        timeout: Upper bound for the whole warm-up, in seconds.
+    """
+    count = _settings.DB_POOL_SIZE if connections is None else connections
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        async with asyncio.timeout(timeout):
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(count):
+                        group.create_task(_ping())
+            except* (OSError, SQLAlchemyError) as failures:
+                logger.warning("Could not prewarm the database pool: %s", failures.exceptions[0])
+    except TimeoutError:
+        logger.warning("Database pool prewarm timed out after %.1fs", timeout)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -31,3 +101,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a session for read-only requests.
+    Statements run without an enclosing transaction; do not write through it.
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
@@ -16,7 +16,7 @@ from app.core.errors.handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
-from app.core.errors.schemas import ErrorDetail, ErrorResponse
+from app.core.errors.schemas import ErrorDetail, ErrorEnvelope, ErrorResponse
 
 __all__ = [
     "AppError",
@@ -25,6 +25,7 @@ __all__ = [
     "BusinessRuleError",
     "DomainError",
     "ErrorDetail",
+    "ErrorEnvelope",
     "ErrorResponse",
     "InvalidOperationError",
     "ResourceConflictError",
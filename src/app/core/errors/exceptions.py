@@ -1,17 +1,38 @@
 import re
-from typing import Any
+from typing import Any, ClassVar
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _code_from_class_name(class_name: str) -> str:
+    """Convert a CamelCase class name to an UPPER_SNAKE_CASE error code."""
+    return _CAMEL_BOUNDARY.sub("_", class_name).upper()
 
 
 class AppError(Exception):
-    """Base exception for application with structured error data."""
+    """Base exception for application with structured error data.
+
+    The message may be a %-style template with its arguments passed as
+    ``args``. It is formatted when the error is created, so a template that
+    does not match its arguments fails at the raise site.
+    """
+
+    _CODE: ClassVar[str] = _code_from_class_name("AppError")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._CODE = _code_from_class_name(cls.__name__)
 
     def __init__(
         self,
         message: str,
         *,
+        args: tuple[Any, ...] = (),
         code: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
+        if args:
+            message = message % args
         self.message = message
         self.code = code or self._default_code()
         self.details = details or {}
@@ -21,9 +42,9 @@ class AppError(Exception):
         """Generate default error code from class name.
 
         Converts "UserNotFoundError" to "USER_NOT_FOUND".
+        The code is computed once per subclass in __init_subclass__.
         """
-        class_name = self.__class__.__name__
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).upper()
+        return type(self)._CODE
 
 
 class ResourceNotFoundError(AppError):
@@ -5,14 +5,16 @@ This module provides centralized exception handling with structured error respon
 """
 
 import logging
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from ..responses import PydanticJSONResponse
 from .exceptions import (
     AppError,
     AuthenticationError,
@@ -21,67 +23,65 @@ from .exceptions import (
     ResourceConflictError,
     ResourceNotFoundError,
 )
+from .schemas import ErrorEnvelope, ErrorResponse
 
 logger = logging.getLogger(__name__)
 
+# (epoch second, timestamp) - refreshed at most once per second
+_ts_cache: tuple[int, datetime] = (0, datetime.fromtimestamp(0, UTC))
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> PydanticJSONResponse:
     """Handler for standard HTTP exceptions.
 
     Handles standard Starlette HTTP exceptions like 404 Not Found,
     405 Method Not Allowed, etc.
     """
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": {
-                "code": _get_http_error_code(exc.status_code),
-                "message": str(exc.detail),
-                "timestamp": datetime.now(UTC).isoformat(),
-                "request_id": _get_request_id(request),
-            }
-        },
+    return _error_response(
+        exc.status_code,
+        ErrorResponse(
+            code=_get_http_error_code(exc.status_code),
+            message=str(exc.detail),
+            timestamp=_now_utc(),
+            request_id=_get_request_id(request),
+        ),
     )
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError | ValidationError
-) -> JSONResponse:
+) -> PydanticJSONResponse:
     """Handler for Pydantic validation errors.
 
     Handles both RequestValidationError (from FastAPI) and ValidationError
     (from Pydantic directly), providing structured field-level error details.
     """
-    errors = []
-    if isinstance(exc, RequestValidationError):
-        errors = exc.errors()
-    elif isinstance(exc, ValidationError):
-        errors = exc.errors()
-
-    formatted_errors = [
-        {
-            "field": ".".join(str(loc) for loc in error["loc"]),
-            "message": error["msg"],
-            "type": error["type"],
-        }
-        for error in errors
-    ]
-
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": "Request validation failed",
-                "details": {"errors": formatted_errors},
-                "timestamp": datetime.now(UTC).isoformat(),
-                "request_id": _get_request_id(request),
-            }
-        },
+    # Both exception types expose the same errors() API
+    formatted_errors = []
+    append = formatted_errors.append
+    for error in exc.errors():
+        loc = error["loc"]
+        if len(loc) == 1 and isinstance(loc[0], str):
+            field = loc[0]
+        else:
+            field = ".".join(map(str, loc))
+        append({"field": field, "message": error["msg"], "type": error["type"]})
+
+    return _error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ErrorResponse(
+            code="VALIDATION_ERROR",
+            message="Request validation failed",
+            details={"errors": formatted_errors},
+            timestamp=_now_utc(),
+            request_id=_get_request_id(request),
+        ),
     )
 
 
-async def app_exception_handler(request: Request, exc: AppError) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppError) -> PydanticJSONResponse:
     """
     Global handler for application exceptions.
 
@@ -92,23 +92,32 @@ async def app_exception_handler(request: Request, exc: AppError) -> JSONResponse
     status_code = _get_status_code_for_exception(exc)
 
     # Build error response
-    error_response = {
-        "error": {
-            "code": exc.code,
-            "message": exc.message,
-            "details": exc.details if exc.details else None,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "request_id": _get_request_id(request),
-        }
-    }
+    error_response = ErrorResponse(
+        code=exc.code,
+        message=exc.message,
+        details=exc.details if exc.details else None,
+        timestamp=_now_utc(),
+        request_id=_get_request_id(request),
+    )
 
     # Log error with appropriate level
     _log_error(exc, request, status_code)
 
-    return JSONResponse(
-        status_code=status_code,
-        content=error_response,
-    )
+    return _error_response(status_code, error_response)
+
+
+def _error_response(status_code: int, error: ErrorResponse) -> PydanticJSONResponse:
+    """Wrap an error in the standard envelope and render it with pydantic-core."""
+    return PydanticJSONResponse(status_code=status_code, content=ErrorEnvelope(error=error))
+
+
+_STATUS_BY_CLASS: dict[type[AppError], int] = {
+    ResourceNotFoundError: status.HTTP_404_NOT_FOUND,
+    ResourceConflictError: status.HTTP_409_CONFLICT,
+    DomainError: status.HTTP_400_BAD_REQUEST,
+    AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+    AuthorizationError: status.HTTP_403_FORBIDDEN,
+}
 
 
 def _get_status_code_for_exception(exc: AppError) -> int:
@@ -117,44 +126,86 @@ def _get_status_code_for_exception(exc: AppError) -> int:
     Returns the appropriate HTTP status code for each exception type,
     following REST API conventions.
     """
-    status_map = {
-        ResourceNotFoundError: status.HTTP_404_NOT_FOUND,
-        ResourceConflictError: status.HTTP_409_CONFLICT,
-        DomainError: status.HTTP_400_BAD_REQUEST,
-        AuthenticationError: status.HTTP_401_UNAUTHORIZED,
-        AuthorizationError: status.HTTP_403_FORBIDDEN,
-    }
-
-    for exc_class, code in status_map.items():
-        if isinstance(exc, exc_class):
+    return _status_for_type(type(exc))
+
+
+@lru_cache(maxsize=64)
+def _status_for_type(exc_type: type[AppError]) -> int:
+    """Resolve the status code for an exception class by walking its MRO.
+
+    The nearest mapped ancestor wins; the result is memoized per class.
+    """
+    for klass in exc_type.__mro__:
+        code = _STATUS_BY_CLASS.get(klass)
+        if code is not None:
             return code
 
     return status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+_HTTP_ERROR_CODES: dict[int, str] = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    409: "CONFLICT",
+    422: "VALIDATION_ERROR",
+    500: "INTERNAL_ERROR",
+}
+
+# Status codes are small ints, so index a flat tuple instead of hashing into a dict
+_HTTP_ERROR_CODE_BY_STATUS: tuple[str | None, ...] = tuple(
+    _HTTP_ERROR_CODES.get(code) for code in range(600)
+)
+
+
 def _get_http_error_code(status_code: int) -> str:
     """Convert HTTP status code to error code string.
 
     Provides consistent error codes for standard HTTP errors.
     """
-    code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        409: "CONFLICT",
-        422: "VALIDATION_ERROR",
-        500: "INTERNAL_ERROR",
-    }
-    return code_map.get(status_code, "HTTP_ERROR")
+    if 0 <= status_code < 600:
+        return _HTTP_ERROR_CODE_BY_STATUS[status_code] or "HTTP_ERROR"
+    return "HTTP_ERROR"
+
+
+def _now_utc() -> datetime:
+    """Return the current UTC time truncated to the second.
+
+    Error bodies only need second resolution, so the datetime is cached
+    and rebuilt once per second instead of on every response.
+    """
+    global _ts_cache
+    now = int(time.time())
+    second, stamp = _ts_cache
+    if now != second:
+        stamp = datetime.fromtimestamp(now, UTC)
+        # Rebind the whole pair so readers never see a mismatched second/stamp
+        _ts_cache = (now, stamp)
+    return stamp
 
 
 def _get_request_id(request: Request) -> str | None:
     """Extract request ID from headers for tracing.
 
     Looks for X-Request-ID header to support distributed tracing.
+    Reads the raw ASGI header list (keys are lowercased bytes) instead of
+    building request.headers, and remembers the result on request.state.
     """
-    return request.headers.get("X-Request-ID")
+    state = request.state
+    try:
+        return state.request_id
+    except AttributeError:
+        pass
+
+    request_id = None
+    for key, value in request.scope["headers"]:
+        if key == b"x-request-id":
+            request_id = value.decode("latin-1")
+            break
+
+    state.request_id = request_id
+    return request_id
 
 
 def _log_error(exc: AppError, request: Request, status_code: int) -> None:
@@ -165,8 +216,12 @@ def _log_error(exc: AppError, request: Request, status_code: int) -> None:
     """
     # Client errors (4xx): log as warning
     if 400 <= status_code < 500:
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning(
-            f"Client error: {exc.code} - {exc.message}",
+            "Client error: %s - %s",
+            exc.code,
+            exc.message,
             extra={
                 "error_code": exc.code,
                 "path": request.url.path,
@@ -176,8 +231,12 @@ def _log_error(exc: AppError, request: Request, status_code: int) -> None:
         )
     # Server errors (5xx): log as error
     else:
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         logger.error(
-            f"Server error: {exc.code} - {exc.message}",
+            "Server error: %s - %s",
+            exc.code,
+            exc.message,
             exc_info=exc,
             extra={
                 "error_code": exc.code,
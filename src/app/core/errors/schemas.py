@@ -7,7 +7,7 @@ This module defines Pydantic models for structured error responses.
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ErrorDetail(BaseModel):
@@ -34,10 +34,8 @@ class ErrorResponse(BaseModel):
     )
     request_id: str | None = Field(None, description="Request ID for tracing")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "code": "USER_NOT_FOUND",
                 "message": "User with ID 123 not found",
@@ -46,3 +44,10 @@ class ErrorResponse(BaseModel):
                 "request_id": "uuid-here",
             }
         }
+    )
+
+
+class ErrorEnvelope(BaseModel):
+    """Top-level body of every error response: {"error": {...}}."""
+
+    error: ErrorResponse
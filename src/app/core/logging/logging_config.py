@@ -11,13 +11,19 @@ from pathlib import Path
 
 from ..config import get_settings
 
+# Handlers added by the last setup_logging() call, replaced on the next one
+_handlers: tuple[logging.Handler, ...] = ()
+
 
 def setup_logging() -> None:
     """Configure application logging.
 
     Sets up console logging for development and optional file logging for
-    production. Suppresses noisy third-party logs.
+    production. Suppresses noisy third-party logs. Calling it again (e.g. on
+    every lifespan startup) replaces the handlers it added before instead of
+    stacking new ones.
     """
+    global _handlers
     settings = get_settings()
 
     # Define log format
@@ -33,8 +39,12 @@ def setup_logging() -> None:
 
     # Root logger configuration
     root_logger = logging.getLogger()
+    for handler in _handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
     root_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
     root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # Optional file handler for production
     if not settings.DEBUG:
@@ -43,7 +53,11 @@ def setup_logging() -> None:
         file_handler = logging.FileHandler(log_dir / "app.log")
         file_handler.setFormatter(logging.Formatter(detailed_format))
         root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    _handlers = tuple(handlers)
 
     # Suppress noisy third-party logs
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO if settings.DEBUG else logging.WARNING
+    )
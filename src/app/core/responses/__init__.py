@@ -0,0 +1,5 @@
+"""Responses module."""
+
+from app.core.responses.json_response import PydanticJSONResponse
+
+__all__ = ["PydanticJSONResponse"]
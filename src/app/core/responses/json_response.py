@@ -0,0 +1,23 @@
+"""
+JSON response classes.
+
+This module provides a JSONResponse that encodes with pydantic-core's
+Rust serializer instead of the standard library json module.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core.
+
+    Accepts plain JSON-compatible data as well as Pydantic models, datetimes
+    and UUIDs, which are encoded natively without a jsonable_encoder pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode the content to JSON bytes."""
+        return to_json(content)
@@ -1,5 +1,11 @@
 """Validation module."""
 
-from app.core.validation.utils import parse_uuid
+from app.core.validation.utils import (
+    decode_cursor,
+    encode_cursor,
+    is_valid_email,
+    parse_uuid,
+    try_parse_uuid,
+)
 
-__all__ = ["parse_uuid"]
+__all__ = ["decode_cursor", "encode_cursor", "is_valid_email", "parse_uuid", "try_parse_uuid"]
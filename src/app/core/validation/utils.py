@@ -4,10 +4,50 @@ Shared validation utilities for common operations.
 This module provides reusable validation functions used across the application.
 """
 
+import binascii
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from uuid import UUID
 
 from ..errors import DomainError
 
+# Shortest address the pattern accepts is "a@b.c"
+_EMAIL_MIN_LENGTH = 5
+
+# Applied with fullmatch: "$" would also accept a trailing newline
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Canonical hyphenated and bare 32-digit hex forms, used with fullmatch
+_UUID_HYPHENATED_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_UUID_HEX_RE = re.compile(r"[0-9a-fA-F]{32}")
+
+
+def try_parse_uuid(value: str) -> UUID | None:
+    """
+    Parse a UUID from string without raising.
+
+    Only the canonical hyphenated and bare 32-digit hex forms are accepted.
+    The shape is checked first, so invalid input never enters UUID()'s
+    exception path.
+
+    Args:
+        value: The string value to parse as UUID.
+
+    Returns:
+        The parsed UUID object, or None if the value is not a valid UUID.
+    """
+    length = len(value)
+    if length == 36:
+        match = _UUID_HYPHENATED_RE.fullmatch(value)
+    elif length == 32:
+        match = _UUID_HEX_RE.fullmatch(value)
+    else:
+        return None
+    return None if match is None else UUID(value)
+
 
 def parse_uuid(value: str, field_name: str = "ID") -> UUID:
     """
@@ -23,11 +63,69 @@ def parse_uuid(value: str, field_name: str = "ID") -> UUID:
     Raises:
         DomainError: If the value is not a valid UUID format.
     """
-    try:
-        return UUID(value)
-    except ValueError as exc:
+    uuid = try_parse_uuid(value)
+    if uuid is None:
         raise DomainError(
-            f"Invalid {field_name.lower()} format: {value}",
+            "Invalid %s format: %s",
+            args=(field_name.lower(), value),
             code=f"INVALID_{field_name.upper()}_FORMAT",
             details={field_name.lower(): value},
+        )
+    return uuid
+
+
+def is_valid_email(value: str | None) -> bool:
+    """
+    Check that a value looks like an email address.
+
+    This is a cheap syntactic check (local@domain.tld), not a deliverability check.
+
+    Args:
+        value: The string value to check.
+
+    Returns:
+        True if the value has a valid email shape, False otherwise.
+    """
+    return (
+        bool(value) and len(value) >= _EMAIL_MIN_LENGTH and _EMAIL_RE.fullmatch(value) is not None
+    )
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """
+    Encode a keyset pagination position as an opaque URL-safe token.
+
+    Args:
+        created_at: Sort timestamp of the last item on the page.
+        item_id: ID of the last item on the page (tie-breaker).
+
+    Returns:
+        The cursor token.
+    """
+    raw = f"{created_at.isoformat()}|{item_id.hex}".encode()
+    return urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(value: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Args:
+        value: The cursor token.
+
+    Returns:
+        The (created_at, id) position to continue after.
+
+    Raises:
+        DomainError: If the token is not a valid cursor.
+    """
+    try:
+        raw = urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode("ascii")
+        created_at, _, item_id = raw.partition("|")
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise DomainError(
+            "Invalid pagination cursor",
+            code="INVALID_CURSOR",
+            details={"cursor": value},
         ) from exc
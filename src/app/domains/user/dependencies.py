@@ -1,7 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_db_readonly
 from app.domains.user.infrastructure.database.user_repository_impl import SQLAlchemyUserRepository
 from app.domains.user.mappers.entity_dto_mapper import UserEntityDtoMapper
 from app.domains.user.mappers.entity_model_mapper import UserEntityModelMapper
@@ -12,15 +12,19 @@ from app.domains.user.use_cases.get_user import (
     GetUserByIdUseCase,
 )
 
+# Mappers are stateless, so one instance is shared by every request
+_ENTITY_MODEL_MAPPER = UserEntityModelMapper()
+_ENTITY_DTO_MAPPER = UserEntityDtoMapper()
+
 
 def get_entity_model_mapper() -> UserEntityModelMapper:
     """Get the entity-model mapper (singleton)."""
-    return UserEntityModelMapper()
+    return _ENTITY_MODEL_MAPPER
 
 
 def get_entity_dto_mapper() -> UserEntityDtoMapper:
     """Get the entity-DTO mapper (singleton)."""
-    return UserEntityDtoMapper()
+    return _ENTITY_DTO_MAPPER
 
 
 def get_user_repository(
@@ -31,6 +35,16 @@ def get_user_repository(
     return SQLAlchemyUserRepository(db, mapper)
 
 
+def get_readonly_user_repository(
+    # scope="function" closes the session (returning its connection to the pool)
+    # as soon as the endpoint returns, before the response body is sent.
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+    mapper: UserEntityModelMapper = Depends(get_entity_model_mapper),
+) -> SQLAlchemyUserRepository:
+    """Get the user repository with a read-only database session."""
+    return SQLAlchemyUserRepository(db, mapper)
+
+
 def get_create_user_use_case(
     repo: SQLAlchemyUserRepository = Depends(get_user_repository),
     mapper: UserEntityDtoMapper = Depends(get_entity_dto_mapper),
@@ -40,7 +54,7 @@ def get_create_user_use_case(
 
 
 def get_user_by_id_use_case(
-    repo: SQLAlchemyUserRepository = Depends(get_user_repository),
+    repo: SQLAlchemyUserRepository = Depends(get_readonly_user_repository),
     mapper: UserEntityDtoMapper = Depends(get_entity_dto_mapper),
 ) -> GetUserByIdUseCase:
     """Get the get user by ID use case."""
@@ -48,7 +62,7 @@ def get_user_by_id_use_case(
 
 
 def get_all_users_use_case(
-    repo: SQLAlchemyUserRepository = Depends(get_user_repository),
+    repo: SQLAlchemyUserRepository = Depends(get_readonly_user_repository),
     mapper: UserEntityDtoMapper = Depends(get_entity_dto_mapper),
 ) -> GetAllUsersUseCase:
     """Get the get all users use case."""
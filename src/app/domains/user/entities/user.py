@@ -5,14 +5,18 @@ This is the core domain entity that represents a User in our system.
 It contains only business logic and has NO dependencies on external frameworks.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from app.core.errors import ValidationError as DomainValidationError
+from app.core.validation import is_valid_email
 
+_now = datetime.now
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """
     User entity representing a user in the system.
@@ -25,7 +29,7 @@ class User:
     name: str
     id: UUID = field(default_factory=uuid4)
     is_active: bool = True
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=lambda: _now(UTC))
     updated_at: datetime | None = None
 
     def __post_init__(self) -> None:
@@ -33,9 +37,26 @@ class User:
         self._validate_email()
         self._validate_name()
 
+    @classmethod
+    def bulk_create(
+        cls, rows: Iterable[tuple[str, str]], now: datetime | None = None
+    ) -> list["User"]:
+        """
+        Create many users sharing one creation timestamp.
+
+        Args:
+            rows: (email, name) pairs.
+            now: Creation timestamp for every user; defaults to the current UTC time.
+
+        Returns:
+            List of new User entities.
+        """
+        created_at = now or _now(UTC)
+        return [cls(email=email, name=name, created_at=created_at) for email, name in rows]
+
     def _validate_email(self) -> None:
         """Validate email format."""
-        if not self.email or "@" not in self.email:
+        if not is_valid_email(self.email):
             raise DomainValidationError(
                 "Invalid email format",
                 code="INVALID_EMAIL_FORMAT",
@@ -54,12 +75,12 @@ class User:
     def deactivate(self) -> None:
         """Deactivate the user."""
         self.is_active = False
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = _now(UTC)
 
     def activate(self) -> None:
         """Activate the user."""
         self.is_active = True
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = _now(UTC)
 
     def update_name(self, new_name: str) -> None:
         """Update user's name."""
@@ -70,4 +91,4 @@ class User:
                 details={"name": new_name},
             )
         self.name = new_name.strip()
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = _now(UTC)
@@ -5,9 +5,13 @@ This is the concrete implementation of the UserRepositoryInterface.
 It uses SQLAlchemy to interact with the database.
 """
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, Uuid, bindparam, insert, select, tuple_
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import update as sql_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import ResourceNotFoundError
@@ -16,6 +20,61 @@ from app.domains.user.infrastructure.database.models import UserModel
 from app.domains.user.mappers.entity_model_mapper import UserEntityModelMapper
 from app.domains.user.repositories.user_repository import UserRepositoryInterface
 
+# Statements built once at import; per-call values are bound at execution.
+_SELECT_BY_ID = select(UserModel).where(UserModel.id == bindparam("id"))
+_SELECT_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"))
+
+# Keyset pagination over the (created_at DESC, id DESC) index. List pages select
+# plain columns rather than UserModel, so no ORM instances are hydrated (see
+# UserEntityModelMapper.row_to_entity for the order).
+_SELECT_FIRST_PAGE = (
+    select(
+        UserModel.id,
+        UserModel.email,
+        UserModel.name,
+        UserModel.is_active,
+        UserModel.created_at,
+        UserModel.updated_at,
+    )
+    .order_by(UserModel.created_at.desc(), UserModel.id.desc())
+    .limit(bindparam("limit"))
+)
+_SELECT_PAGE_AFTER = _SELECT_FIRST_PAGE.where(
+    tuple_(UserModel.created_at, UserModel.id)
+    < tuple_(
+        bindparam("cursor_created_at", type_=DateTime(timezone=True)),
+        bindparam("cursor_id", type_=Uuid),
+    )
+)
+
+# INSERT ... RETURNING; for a parameter list SQLAlchemy batches the rows into
+# multi-row VALUES statements ("insertmanyvalues").
+_INSERT_RETURNING = insert(UserModel).returning(UserModel, sort_by_parameter_order=True)
+_INSERT_IF_ABSENT = (
+    pg_insert(UserModel)
+    .on_conflict_do_nothing(index_elements=[UserModel.email])
+    .returning(UserModel)
+)
+
+# Single round trip DML. Bind names must differ from column names in SET clauses.
+_UPDATE_BY_ID = (
+    sql_update(UserModel)
+    .where(UserModel.id == bindparam("user_id"))
+    .values(
+        email=bindparam("new_email"),
+        name=bindparam("new_name"),
+        is_active=bindparam("new_is_active"),
+        updated_at=bindparam("new_updated_at"),
+    )
+    .returning(UserModel)
+    .execution_options(synchronize_session=False, populate_existing=True)
+)
+_DELETE_BY_ID = (
+    sql_delete(UserModel)
+    .where(UserModel.id == bindparam("user_id"))
+    .execution_options(synchronize_session=False)
+)
+
 
 class SQLAlchemyUserRepository(UserRepositoryInterface):
     """
@@ -38,16 +97,36 @@ class SQLAlchemyUserRepository(UserRepositoryInterface):
 
     async def create(self, user: User) -> User:
         """Create a new user in the database."""
-        model = self._mapper.to_model(user)
-        self._db.add(model)
+        result = await self._db.execute(_INSERT_RETURNING, self._mapper.to_model_dict(user))
+        model = result.scalar_one()
+        await self._db.commit()
+        return self._mapper.to_entity(model)
+
+    async def create_many(self, users: list[User]) -> list[User]:
+        """Create several users with batched multi-row INSERT ... RETURNING."""
+        if not users:
+            return []
+
+        to_model_dict = self._mapper.to_model_dict
+        result = await self._db.scalars(_INSERT_RETURNING, [to_model_dict(u) for u in users])
+        models = result.all()
+        await self._db.commit()
+        return self._mapper.to_entities(models)
+
+    async def create_if_not_exists(self, user: User) -> User | None:
+        """Create a user with INSERT ... ON CONFLICT (email) DO NOTHING RETURNING."""
+        result = await self._db.execute(_INSERT_IF_ABSENT, self._mapper.to_model_dict(user))
+        model = result.scalar_one_or_none()
+
+        if model is None:
+            return None
+
         await self._db.commit()
-        await self._db.refresh(model)
         return self._mapper.to_entity(model)
 
     async def get_by_id(self, user_id: UUID) -> User | None:
         """Get a user by their ID."""
-        query = select(UserModel).where(UserModel.id == str(user_id))
-        result = await self._db.execute(query)
+        result = await self._db.execute(_SELECT_BY_ID, {"id": user_id})
         model = result.scalars().first()
 
         if model is None:
@@ -57,8 +136,7 @@ class SQLAlchemyUserRepository(UserRepositoryInterface):
 
     async def get_by_email(self, email: str) -> User | None:
         """Get a user by their email."""
-        query = select(UserModel).where(UserModel.email == email)
-        result = await self._db.execute(query)
+        result = await self._db.execute(_SELECT_BY_EMAIL, {"email": email})
         model = result.scalars().first()
 
         if model is None:
@@ -66,47 +144,52 @@ class SQLAlchemyUserRepository(UserRepositoryInterface):
 
         return self._mapper.to_entity(model)
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        """Get all users with pagination."""
-        query = select(UserModel).offset(skip).limit(limit)
-        result = await self._db.execute(query)
-        models = result.scalars().all()
-        return self._mapper.to_entities(models)
+    async def get_all(
+        self, limit: int = 100, cursor: tuple[datetime, UUID] | None = None
+    ) -> list[User]:
+        """Get a page of users, newest first, continuing after the cursor."""
+        if cursor is None:
+            result = await self._db.execute(_SELECT_FIRST_PAGE, {"limit": limit})
+        else:
+            result = await self._db.execute(
+                _SELECT_PAGE_AFTER,
+                {"limit": limit, "cursor_created_at": cursor[0], "cursor_id": cursor[1]},
+            )
+        return self._mapper.rows_to_entities(result)
 
     async def update(self, user: User) -> User:
         """Update an existing user."""
-        query = select(UserModel).where(UserModel.id == str(user.id))
-        result = await self._db.execute(query)
-        model = result.scalars().first()
+        result = await self._db.execute(
+            _UPDATE_BY_ID,
+            {
+                "user_id": user.id,
+                "new_email": user.email,
+                "new_name": user.name,
+                "new_is_active": user.is_active,
+                "new_updated_at": user.updated_at,
+            },
+        )
+        model = result.scalar_one_or_none()
 
         if model is None:
             raise ResourceNotFoundError(
-                f"User with ID {user.id} not found",
+                "User with ID %s not found",
+                args=(user.id,),
                 code="USER_NOT_FOUND",
                 details={"user_id": str(user.id)},
             )
 
-        model.email = user.email
-        model.name = user.name
-        model.is_active = user.is_active
-        model.updated_at = user.updated_at
-
-        self._db.add(model)
         await self._db.commit()
-        await self._db.refresh(model)
 
         return self._mapper.to_entity(model)
 
     async def delete(self, user_id: UUID) -> bool:
         """Delete a user by their ID."""
-        query = select(UserModel).where(UserModel.id == str(user_id))
-        result = await self._db.execute(query)
-        model = result.scalars().first()
+        result = await self._db.execute(_DELETE_BY_ID, {"user_id": user_id})
 
-        if model is None:
+        if result.rowcount == 0:
             return False
 
-        await self._db.delete(model)
         await self._db.commit()
 
         return True
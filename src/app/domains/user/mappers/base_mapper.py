@@ -1,40 +1,13 @@
 """Base Mapper with common utilities for type conversions."""
 
 from datetime import datetime
-from uuid import UUID
 
 
 class BaseMapper:
     """Base mapper with common type conversion utilities."""
 
-    @staticmethod
-    def convert_uuid_to_str(uuid_obj: UUID | None) -> str | None:
-        """
-        Convert UUID to string representation.
-
-        Args:
-            uuid_obj: UUID object or None
-
-        Returns:
-            String representation of UUID or None
-        """
-        return str(uuid_obj) if uuid_obj else None
-
-    @staticmethod
-    def convert_str_to_uuid(uuid_str: str | None) -> UUID | None:
-        """
-        Convert string to UUID.
-
-        Args:
-            uuid_str: String representation of UUID or None
-
-        Returns:
-            UUID object or None
-
-        Raises:
-            ValueError: If string is not a valid UUID
-        """
-        return UUID(uuid_str) if uuid_str else None
+    # Mappers are stateless; no per-instance __dict__
+    __slots__ = ()
 
     @staticmethod
     def convert_datetime_to_iso(dt: datetime | None) -> str | None:
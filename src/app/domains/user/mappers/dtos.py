@@ -1,4 +1,11 @@
-"""Pydantic DTOs for User domain."""
+"""DTOs for User domain.
+
+The input DTO is a Pydantic model so it validates what it is given.
+Output DTOs are built from already-validated entities, so they are plain
+slotted, frozen dataclasses: cheap to construct and immutable once returned.
+"""
+
+from dataclasses import dataclass
 
 from pydantic import BaseModel, Field
 
@@ -10,20 +17,30 @@ class CreateUserInputDTO(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
 
 
-class CreateUserOutputDTO(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CreateUserOutputDTO:
     """Output DTO after creating a user."""
 
-    id: str = Field(..., description="User's unique identifier")
-    email: str = Field(..., description="User's email address")
-    name: str = Field(..., description="User's name")
-    is_active: bool = Field(..., description="Whether the user is active")
+    id: str
+    email: str
+    name: str
+    is_active: bool
 
 
-class GetUserOutputDTO(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GetUserOutputDTO:
     """Output DTO for retrieving a user."""
 
-    id: str = Field(..., description="User's unique identifier")
-    email: str = Field(..., description="User's email address")
-    name: str = Field(..., description="User's name")
-    is_active: bool = Field(..., description="Whether the user is active")
-    created_at: str = Field(..., description="User creation timestamp in ISO format")
+    id: str
+    email: str
+    name: str
+    is_active: bool
+    created_at: str  # ISO 8601
+
+
+@dataclass(slots=True, frozen=True)
+class GetUsersPageOutputDTO:
+    """Output DTO for a page of users."""
+
+    users: list[GetUserOutputDTO]
+    next_cursor: str | None = None  # Cursor for the next page, if any
@@ -1,5 +1,8 @@
 """Mapper for User Entity ↔ UserModel conversions."""
 
+from collections.abc import Iterable, Sequence
+from typing import Any
+
 from app.domains.user.entities.user import User
 from app.domains.user.infrastructure.database.models import UserModel
 from app.domains.user.mappers.base_mapper import BaseMapper
@@ -8,6 +11,8 @@ from app.domains.user.mappers.base_mapper import BaseMapper
 class UserEntityModelMapper(BaseMapper):
     """Mapper for converting between User entity and UserModel."""
 
+    __slots__ = ()
+
     def to_entity(self, model: UserModel) -> User:
         """
         Convert SQLAlchemy model to domain entity.
@@ -19,7 +24,7 @@ class UserEntityModelMapper(BaseMapper):
             User domain entity
         """
         return User(
-            id=self.convert_str_to_uuid(model.id),
+            id=model.id,
             email=model.email,
             name=model.name,
             is_active=model.is_active,
@@ -27,6 +32,28 @@ class UserEntityModelMapper(BaseMapper):
             updated_at=model.updated_at,
         )
 
+    def row_to_entity(self, row: Sequence[Any]) -> User:
+        """
+        Convert a column-selected row to domain entity.
+
+        The row is read by position, in the order
+        (id, email, name, is_active, created_at, updated_at).
+
+        Args:
+            row: Core Row (or tuple) of user columns
+
+        Returns:
+            User domain entity
+        """
+        return User(
+            id=row[0],
+            email=row[1],
+            name=row[2],
+            is_active=row[3],
+            created_at=row[4],
+            updated_at=row[5],
+        )
+
     def to_model(self, entity: User) -> UserModel:
         """
         Convert domain entity to SQLAlchemy model.
@@ -38,7 +65,7 @@ class UserEntityModelMapper(BaseMapper):
             SQLAlchemy UserModel instance
         """
         return UserModel(
-            id=self.convert_uuid_to_str(entity.id),
+            id=entity.id,
             email=entity.email,
             name=entity.name,
             is_active=entity.is_active,
@@ -46,17 +73,50 @@ class UserEntityModelMapper(BaseMapper):
             updated_at=entity.updated_at,
         )
 
-    def to_entities(self, models: list[UserModel]) -> list[User]:
+    def to_model_dict(self, entity: User) -> dict[str, Any]:
+        """
+        Convert domain entity to a column-value dict for Core INSERT statements.
+
+        Args:
+            entity: User domain entity
+
+        Returns:
+            Dict keyed by UserModel column name
+        """
+        return {
+            "id": entity.id,
+            "email": entity.email,
+            "name": entity.name,
+            "is_active": entity.is_active,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
+    def to_entities(self, models: Iterable[UserModel]) -> list[User]:
         """
         Convert multiple SQLAlchemy models to domain entities.
 
         Args:
-            models: List of UserModel instances
+            models: Iterable of UserModel instances (e.g. a ScalarResult)
+
+        Returns:
+            List of User domain entities
+        """
+        to_entity = self.to_entity
+        return [to_entity(model) for model in models]
+
+    def rows_to_entities(self, rows: Iterable[Sequence[Any]]) -> list[User]:
+        """
+        Convert multiple column-selected rows to domain entities.
+
+        Args:
+            rows: Iterable of rows (e.g. a Result of a column select)
 
         Returns:
             List of User domain entities
         """
-        return [self.to_entity(model) for model in models]
+        row_to_entity = self.row_to_entity
+        return [row_to_entity(row) for row in rows]
 
     def to_models(self, entities: list[User]) -> list[UserModel]:
         """
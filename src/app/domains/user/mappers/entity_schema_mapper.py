@@ -11,7 +11,13 @@ from app.domains.user.presentation.v1.schemas import (
 
 
 class UserEntitySchemaMapper(BaseMapper):
-    """Mapper for converting between User entity and Pydantic schemas."""
+    """Mapper for converting between User entity and Pydantic schemas.
+
+    Response schemas are built with model_construct: the data comes from a
+    validated entity, so re-running Pydantic validation would be wasted work.
+    """
+
+    __slots__ = ()
 
     def to_response(self, entity: User) -> UserResponse:
         """
@@ -23,13 +29,11 @@ class UserEntitySchemaMapper(BaseMapper):
         Returns:
             UserResponse schema
         """
-        return UserResponse.model_validate(
-            {
-                "id": self.convert_uuid_to_str(entity.id),
-                "email": entity.email,
-                "name": entity.name,
-                "is_active": entity.is_active,
-            }
+        return UserResponse.model_construct(
+            id=str(entity.id),
+            email=entity.email,
+            name=entity.name,
+            is_active=entity.is_active,
         )
 
     def to_detail_response(self, entity: User) -> UserDetailResponse:
@@ -42,14 +46,12 @@ class UserEntitySchemaMapper(BaseMapper):
         Returns:
             UserDetailResponse schema
         """
-        return UserDetailResponse.model_validate(
-            {
-                "id": self.convert_uuid_to_str(entity.id),
-                "email": entity.email,
-                "name": entity.name,
-                "is_active": entity.is_active,
-                "created_at": self.convert_datetime_to_iso(entity.created_at),
-            }
+        return UserDetailResponse.model_construct(
+            id=str(entity.id),
+            email=entity.email,
+            name=entity.name,
+            is_active=entity.is_active,
+            created_at=entity.created_at.isoformat(),
         )
 
     def from_create_request(self, request: UserCreateRequest) -> User:
@@ -74,8 +76,18 @@ class UserEntitySchemaMapper(BaseMapper):
         Returns:
             UserListResponse schema
         """
-        return UserListResponse(
-            users=[self.to_detail_response(entity) for entity in entities],
+        construct = UserDetailResponse.model_construct
+        return UserListResponse.model_construct(
+            users=[
+                construct(
+                    id=str(entity.id),
+                    email=entity.email,
+                    name=entity.name,
+                    is_active=entity.is_active,
+                    created_at=entity.created_at.isoformat(),
+                )
+                for entity in entities
+            ],
             total=len(entities),
         )
 
@@ -5,7 +5,10 @@ This is the presentation layer - it handles HTTP requests/responses.
 It uses dependency injection to get use cases.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Annotated, TypedDict
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from pydantic import TypeAdapter
 
 from app.domains.user.dependencies import (
     get_all_users_use_case,
@@ -16,6 +19,7 @@ from app.domains.user.dependencies import (
 from app.domains.user.mappers.dtos import (
     CreateUserInputDTO as CreateUserInput,
 )
+from app.domains.user.mappers.dtos import GetUserOutputDTO
 from app.domains.user.presentation.v1.schemas import (
     MessageResponse,
     UserCreateRequest,
@@ -33,6 +37,16 @@ from app.domains.user.use_cases.get_user import (
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
+class _UserListPayload(TypedDict):
+    users: list[GetUserOutputDTO]
+    total: int
+    next_cursor: str | None
+
+
+# Built once so the list serializer schema is compiled at import, not per request
+_USER_LIST_ADAPTER = TypeAdapter(_UserListPayload)
+
+
 # ============== API Endpoints ==============
 
 
@@ -50,25 +64,32 @@ async def create_user(
     input_data = CreateUserInput(email=request.email, name=request.name)
     output = await use_case.execute(input_data)
 
-    return UserResponse.model_validate(output.model_dump())
+    return UserResponse.model_validate(output)
 
 
 @router.get(
     "",
     response_model=UserListResponse,
     summary="Get all users",
-    description="Retrieve a list of all users with pagination.",
+    description=(
+        "Retrieve users, newest first. Pass the returned next_cursor as cursor to get "
+        "the following page."
+    ),
 )
 async def get_users(
-    skip: int = 0, limit: int = 100, use_case: GetAllUsersUseCase = Depends(get_all_users_use_case)
-) -> UserListResponse:
-    """Get all users with pagination."""
-    users_dto = await use_case.execute(skip=skip, limit=limit)
-
-    return UserListResponse(
-        users=[UserDetailResponse.model_validate(user.model_dump()) for user in users_dto],
-        total=len(users_dto),
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    cursor: str | None = None,
+    use_case: GetAllUsersUseCase = Depends(get_all_users_use_case),
+) -> Response:
+    """Get all users with keyset pagination."""
+    page = await use_case.execute(limit=limit, cursor=cursor)
+
+    # The DTOs already have the UserListResponse item shape; returning a response
+    # directly skips FastAPI's response_model re-validation of every row.
+    body = _USER_LIST_ADAPTER.dump_json(
+        {"users": page.users, "total": len(page.users), "next_cursor": page.next_cursor}
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -83,7 +104,7 @@ async def get_user(
     """Get a user by their ID."""
     output = await use_case.execute(user_id)
 
-    return UserDetailResponse.model_validate(output.model_dump())
+    return UserDetailResponse.model_validate(output)
 
 
 @router.delete(
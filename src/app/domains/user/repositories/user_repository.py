@@ -7,6 +7,7 @@ This follows the Dependency Inversion Principle.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from app.domains.user.entities.user import User
@@ -33,6 +34,34 @@ class UserRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, users: list[User]) -> list[User]:
+        """
+        Create several users in one batch.
+
+        Args:
+            users: User entities to create.
+
+        Returns:
+            Created user entities, in the same order as the input.
+        """
+        pass
+
+    @abstractmethod
+    async def create_if_not_exists(self, user: User) -> User | None:
+        """
+        Create a new user unless one with the same email already exists.
+
+        The existence check and the insert happen atomically.
+
+        Args:
+            user: User entity to create.
+
+        Returns:
+            Created user entity, or None if the email is already taken.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> User | None:
         """
@@ -60,13 +89,16 @@ class UserRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_all(
+        self, limit: int = 100, cursor: tuple[datetime, UUID] | None = None
+    ) -> list[User]:
         """
-        Get all users with pagination.
+        Get users with keyset pagination, ordered by (created_at, id) descending.
 
         Args:
-            skip: Number of records to skip.
             limit: Maximum number of records to return.
+            cursor: (created_at, id) of the last user on the previous page, or None
+                for the first page.
 
         Returns:
             List of user entities.
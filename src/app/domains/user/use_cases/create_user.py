@@ -59,20 +59,26 @@ class CreateUserUseCase:
             UserAlreadyExistsError: If a user with the email already exists.
             ValueError: If the input data is invalid.
         """
-        # Check if user already exists
-        existing_user = await self._user_repository.get_by_email(input_data.email)
-        if existing_user is not None:
+        # New users get a lowercased email. Rows created before this keep their
+        # original case, and the unique index compares raw values, so this does
+        # not stop "John@x.com" and "john@x.com" from both existing
+        email = input_data.email.lower()
+        if email != input_data.email:
+            input_data = input_data.model_copy(update={"email": email})
+
+        # Create the user entity from input DTO (this validates business rules,
+        # including the email format, before any database access)
+        user = self._mapper.from_create_input(input_data)
+
+        # Persist the user; the email uniqueness check happens in the same statement
+        created_user = await self._user_repository.create_if_not_exists(user)
+        if created_user is None:
             raise UserAlreadyExistsError(
-                f"User with email {input_data.email} already exists",
+                "User with email %s already exists",
+                args=(user.email,),
                 code="USER_ALREADY_EXISTS",
-                details={"email": input_data.email},
+                details={"email": user.email},
             )
 
-        # Create the user entity from input DTO (this validates business rules)
-        user = self._mapper.from_create_input(input_data)
-
-        # Persist the user
-        created_user = await self._user_repository.create(user)
-
         # Return the output using mapper
         return self._mapper.to_create_output(created_user)
@@ -12,7 +12,10 @@ from app.domains.user.use_cases.get_user import UserNotFoundError
 class DeleteUserUseCase:
     """Use case for deleting a user."""
 
-    def __init__(self, user_repository: UserRepositoryInterface) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepositoryInterface,
+    ) -> None:
         """Initialize the use case with dependencies."""
         self._user_repository = user_repository
 
@@ -35,7 +38,8 @@ class DeleteUserUseCase:
         deleted = await self._user_repository.delete(uuid)
         if not deleted:
             raise UserNotFoundError(
-                f"User with ID {user_id} not found",
+                "User with ID %s not found",
+                args=(user_id,),
                 code="USER_NOT_FOUND",
                 details={"user_id": user_id},
             )
@@ -5,8 +5,9 @@ This contains the application business logic for retrieving users.
 """
 
 from app.core.errors import ResourceNotFoundError
-from app.core.validation import parse_uuid
+from app.core.validation import decode_cursor, encode_cursor, parse_uuid
 from app.domains.user.mappers.dtos import GetUserOutputDTO as GetUserOutput
+from app.domains.user.mappers.dtos import GetUsersPageOutputDTO as GetUsersPageOutput
 from app.domains.user.mappers.entity_dto_mapper import UserEntityDtoMapper
 from app.domains.user.repositories.user_repository import UserRepositoryInterface
 
@@ -48,7 +49,8 @@ class GetUserByIdUseCase:
         user = await self._user_repository.get_by_id(uuid)
         if user is None:
             raise UserNotFoundError(
-                f"User with ID {user_id} not found",
+                "User with ID %s not found",
+                args=(user_id,),
                 code="USER_NOT_FOUND",
                 details={"user_id": user_id},
             )
@@ -68,17 +70,28 @@ class GetAllUsersUseCase:
         self._user_repository = user_repository
         self._mapper = mapper
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> list[GetUserOutput]:
+    async def execute(self, limit: int = 100, cursor: str | None = None) -> GetUsersPageOutput:
         """
         Execute get all users use case.
 
         Args:
-            skip: Number of records to skip.
             limit: Maximum number of records to return.
+            cursor: Opaque cursor from a previous page, or None for the first page.
 
         Returns:
-            List of user output data.
+            A page of user output data and the cursor for the next page.
+
+        Raises:
+            DomainError: If the cursor is not valid.
         """
-        users = await self._user_repository.get_all(skip=skip, limit=limit)
+        position = decode_cursor(cursor) if cursor is not None else None
+
+        users = await self._user_repository.get_all(limit=limit, cursor=position)
+
+        # A short page means there is nothing after it
+        next_cursor = None
+        if users and len(users) == limit:
+            last = users[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
 
-        return self._mapper.to_get_outputs(users)
+        return GetUsersPageOutput(users=self._mapper.to_get_outputs(users), next_cursor=next_cursor)
@@ -7,13 +7,15 @@ It wires together all the components and starts the server.
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.core.config import get_settings, reloader
+from app.core.config import Settings, get_settings, reload_settings, reloader
+from app.core.database import engine, warm_pool
 from app.core.errors import (
     AppError,
     app_exception_handler,
@@ -21,10 +23,28 @@ from app.core.errors import (
     validation_exception_handler,
 )
 from app.core.logging import setup_logging
+from app.core.responses import PydanticJSONResponse
 from app.domains.user.presentation.v1.router import router as user_router
 
-# Setup logging before creating the app
-setup_logging()
+_settings = get_settings()
+
+# Concrete CORS lists: Starlette matches these by membership and only echoes
+# what a preflight actually asked for when it is allowed. The origins are used
+# as configured; an empty list allows no cross-origin requests.
+_CORS_ORIGINS = tuple(_settings.CORS_ALLOWED_ORIGINS)
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+_CORS_HEADERS = ("Authorization", "Content-Type", "X-Request-ID")
+
+# (settings, encoded body): rebuilt only when a reload swaps the settings object
+_health_cache: tuple[Settings | None, bytes] = (None, b"")
+
+_API_INFO_BODY = to_json(
+    {
+        "message": "Welcome to FastAPI Clean Architecture",
+        "version": "v1",
+        "docs": "/docs",
+    }
+)
 
 
 @asynccontextmanager
@@ -34,32 +54,38 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events.
     """
-    # Startup: Start settings reloader
+    # Startup: Load settings fresh, configure logging from them, start the
+    # reloader that swaps them, and open the database pool's connections
+    reload_settings()
+    setup_logging()
     await reloader.start()
+    await warm_pool()
 
     yield
 
-    # Shutdown: Stop settings reloader
+    # Shutdown: Stop settings reloader and close the pool's connections
     await reloader.stop()
+    await engine.dispose()
 
 
 app = FastAPI(
-    title=get_settings().APP_NAME,
+    title=_settings.APP_NAME,
     description="A FastAPI application implementing Clean Architecture principles",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
 )
 
 # Include routers
-app.include_router(user_router, prefix=get_settings().API_V1_PREFIX)
+app.include_router(user_router, prefix=_settings.API_V1_PREFIX)
 
 # Register exception handlers
 app.add_exception_handler(AppError, app_exception_handler)
@@ -69,16 +95,18 @@ app.add_exception_handler(ValidationError, validation_exception_handler)
 
 
 @app.get("/", tags=["Health"])
-def health_check():
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "app": get_settings().APP_NAME}
+    global _health_cache
+    settings = get_settings()
+    cached_settings, body = _health_cache
+    if cached_settings is not settings:
+        body = to_json({"status": "healthy", "app": settings.APP_NAME})
+        _health_cache = (settings, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/v1", tags=["Health"])
-def api_info():
+def api_info() -> Response:
     """API information endpoint."""
-    return {
-        "message": "Welcome to FastAPI Clean Architecture",
-        "version": "v1",
-        "docs": "/docs",
-    }
+    return Response(content=_API_INFO_BODY, media_type="application/json")
@@ -0,0 +1,81 @@
+"""Tests for the in-process TTL cache."""
+
+import asyncio
+
+from app.core.cache import TTLCache
+
+
+async def _slow_load(key: int) -> str:
+    await asyncio.sleep(0.01)
+    return f"user-{key}"
+
+
+def test_get_or_load_caches_the_loaded_value() -> None:
+    async def scenario() -> None:
+        cache: TTLCache[int, str] = TTLCache(maxsize=8, ttl=60)
+        assert await cache.get_or_load(1, _slow_load) == "user-1"
+        assert cache.get(1) == "user-1"
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_does_not_cache_a_load_that_overlapped_a_pop() -> None:
+    async def scenario() -> None:
+        cache: TTLCache[int, str] = TTLCache(maxsize=8, ttl=60)
+        load = asyncio.create_task(cache.get_or_load(1, _slow_load))
+        await asyncio.sleep(0)
+        cache.pop(1)
+        assert await load == "user-1"
+        assert cache.get(1) is None
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_does_not_cache_a_load_that_overlapped_a_clear() -> None:
+    async def scenario() -> None:
+        cache: TTLCache[int, str] = TTLCache(maxsize=8, ttl=60)
+        load = asyncio.create_task(cache.get_or_load(1, _slow_load))
+        await asyncio.sleep(0)
+        cache.clear()
+        assert await load == "user-1"
+        assert cache.get(1) is None
+        assert await cache.get_or_load(1, _slow_load) == "user-1"
+        assert cache.get(1) == "user-1"
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_runs_one_load_for_concurrent_misses_of_a_missing_key() -> None:
+    calls = 0
+
+    async def load_missing(key: int) -> str | None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return None
+
+    async def scenario() -> None:
+        cache: TTLCache[int, str] = TTLCache(maxsize=8, ttl=60)
+        results = await asyncio.gather(*(cache.get_or_load(1, load_missing) for _ in range(20)))
+        assert results == [None] * 20
+        assert calls == 1
+        assert cache.get(1) is None
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_shares_one_load_between_concurrent_misses() -> None:
+    calls = 0
+
+    async def load(key: int) -> str:
+        nonlocal calls
+        calls += 1
+        return await _slow_load(key)
+
+    async def scenario() -> None:
+        cache: TTLCache[int, str] = TTLCache(maxsize=8, ttl=60)
+        results = await asyncio.gather(*(cache.get_or_load(1, load) for _ in range(20)))
+        assert results == ["user-1"] * 20
+        assert calls == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,83 @@
+"""Tests for shared validation utilities."""
+
+from base64 import urlsafe_b64encode
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+
+from app.core.errors import DomainError
+from app.core.validation import decode_cursor, encode_cursor, is_valid_email
+
+_CREATED_AT = datetime(2024, 5, 17, 8, 30, 15, 123456, tzinfo=UTC)
+_ITEM_ID = UUID("3f2c1b9e-8d4a-4c6f-9e2b-7a1d5c8e0f34")
+
+
+def _b64(raw: bytes) -> str:
+    return urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize("value", ["a@b.c", "bob@example.com", "first.last@sub.example.org"])
+def test_is_valid_email_accepts_valid_addresses(value: str) -> None:
+    assert is_valid_email(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        None,
+        "bob",
+        "bob@example",
+        "bob@@example.com",
+        "bob smith@example.com",
+        "bob@example.com\n",
+        "\nbob@example.com",
+    ],
+)
+def test_is_valid_email_rejects_invalid_addresses(value: str | None) -> None:
+    assert not is_valid_email(value)
+
+
+def test_cursor_round_trips_position() -> None:
+    cursor = encode_cursor(_CREATED_AT, _ITEM_ID)
+
+    assert decode_cursor(cursor) == (_CREATED_AT, _ITEM_ID)
+
+
+def test_cursor_is_url_safe_without_padding() -> None:
+    cursor = encode_cursor(_CREATED_AT, _ITEM_ID)
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+def test_cursors_with_tied_created_at_differ_by_id() -> None:
+    other_id = UUID("00000000-0000-4000-8000-000000000001")
+
+    first = encode_cursor(_CREATED_AT, _ITEM_ID)
+    second = encode_cursor(_CREATED_AT, other_id)
+
+    assert first != second
+    assert decode_cursor(second) == (_CREATED_AT, other_id)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "not a cursor!",
+        encode_cursor(_CREATED_AT, _ITEM_ID)[:-5],
+        _b64(b"\xff\xfe\xfd"),
+        _b64(b"2024-05-17T08:30:15+00:00"),
+        _b64(b"2024-05-17T08:30:15+00:00|not-a-uuid"),
+        _b64(f"yesterday|{_ITEM_ID.hex}".encode()),
+    ],
+)
+def test_decode_cursor_rejects_tampered_or_garbage_tokens(value: str) -> None:
+    with pytest.raises(DomainError) as exc_info:
+        decode_cursor(value)
+
+    assert exc_info.value.code == "INVALID_CURSOR"
+    assert exc_info.value.details == {"cursor": value}
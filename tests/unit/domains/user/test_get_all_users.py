@@ -0,0 +1,111 @@
+"""Tests for keyset pagination in GetAllUsersUseCase."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from app.core.errors import DomainError
+from app.domains.user.entities.user import User
+from app.domains.user.mappers.entity_dto_mapper import UserEntityDtoMapper
+from app.domains.user.use_cases.get_user import GetAllUsersUseCase
+
+_T0 = datetime(2024, 5, 17, 8, 30, tzinfo=UTC)
+
+
+class _InMemoryUserRepository:
+    """Applies the same (created_at DESC, id DESC) keyset as the SQL repository."""
+
+    def __init__(self, users: list[User]) -> None:
+        self._users = sorted(users, key=lambda u: (u.created_at, u.id), reverse=True)
+        self.cursors: list[tuple[datetime, UUID] | None] = []
+
+    async def get_all(
+        self, limit: int = 100, cursor: tuple[datetime, UUID] | None = None
+    ) -> list[User]:
+        self.cursors.append(cursor)
+        users = self._users
+        if cursor is not None:
+            users = [u for u in users if (u.created_at, u.id) < cursor]
+        return users[:limit]
+
+
+def _user(n: int, created_at: datetime) -> User:
+    return User(
+        email=f"user{n}@example.com",
+        name=f"User {n}",
+        id=UUID(int=n),
+        created_at=created_at,
+    )
+
+
+def _collect_pages(repo: _InMemoryUserRepository, limit: int) -> list[list[str]]:
+    use_case = GetAllUsersUseCase(repo, UserEntityDtoMapper())
+
+    async def scenario() -> list[list[str]]:
+        pages: list[list[str]] = []
+        cursor = None
+        while True:
+            page = await use_case.execute(limit=limit, cursor=cursor)
+            pages.append([user.id for user in page.users])
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+
+    return asyncio.run(scenario())
+
+
+def test_pages_walk_every_user_once_newest_first() -> None:
+    users = [_user(n, _T0 + timedelta(seconds=n)) for n in range(1, 6)]
+
+    pages = _collect_pages(_InMemoryUserRepository(users), limit=2)
+
+    assert pages == [
+        [str(UUID(int=5)), str(UUID(int=4))],
+        [str(UUID(int=3)), str(UUID(int=2))],
+        [str(UUID(int=1))],
+    ]
+
+
+def test_pages_break_created_at_ties_by_id() -> None:
+    users = [_user(n, _T0) for n in range(1, 6)]
+
+    pages = _collect_pages(_InMemoryUserRepository(users), limit=2)
+
+    flat = [user_id for page in pages for user_id in page]
+    assert flat == [str(UUID(int=n)) for n in range(5, 0, -1)]
+
+
+def test_short_last_page_has_no_next_cursor() -> None:
+    users = [_user(n, _T0 + timedelta(seconds=n)) for n in range(1, 4)]
+    use_case = GetAllUsersUseCase(_InMemoryUserRepository(users), UserEntityDtoMapper())
+
+    page = asyncio.run(use_case.execute(limit=5))
+
+    assert len(page.users) == 3
+    assert page.next_cursor is None
+
+
+def test_full_last_page_is_followed_by_an_empty_page() -> None:
+    users = [_user(n, _T0 + timedelta(seconds=n)) for n in range(1, 5)]
+    repo = _InMemoryUserRepository(users)
+
+    pages = _collect_pages(repo, limit=2)
+
+    assert [len(page) for page in pages] == [2, 2, 0]
+    assert repo.cursors[1:] == [
+        (_T0 + timedelta(seconds=3), UUID(int=3)),
+        (_T0 + timedelta(seconds=1), UUID(int=1)),
+    ]
+
+
+def test_invalid_cursor_is_rejected_before_querying() -> None:
+    repo = _InMemoryUserRepository([])
+    use_case = GetAllUsersUseCase(repo, UserEntityDtoMapper())
+
+    with pytest.raises(DomainError) as exc_info:
+        asyncio.run(use_case.execute(cursor="not a cursor!"))
+
+    assert exc_info.value.code == "INVALID_CURSOR"
+    assert repo.cursors == []